@@ -0,0 +1,39 @@
+"""
+Per-request profiling, switched on with TURFZONE_PROFILE=1 (see settings/base.py).
+
+Each profiled request writes a cProfile file to PROFILE_DIR. Open it with
+`python -m pstats`, snakeviz, or turn it into a flamegraph with flameprof.
+"""
+
+import cProfile
+import logging
+import time
+
+from django.conf import settings
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.views = set(settings.PROFILE_VIEWS)
+        settings.PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    def __call__(self, request):
+        try:
+            url_name = resolve(request.path_info).url_name or 'unnamed'
+        except Resolver404:
+            url_name = None
+
+        if url_name is None or (self.views and url_name not in self.views):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        response = profiler.runcall(self.get_response, request)
+
+        path = settings.PROFILE_DIR / f"{url_name}-{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns()}.prof"
+        profiler.dump_stats(path)
+        logger.warning("Profiled %s %s -> %s", request.method, request.path, path)
+        return response
@@ -1,5 +1,9 @@
 """
-Django settings for core project.
+Shared Django settings for core project.
+
+Pick a profile with DJANGO_SETTINGS_MODULE:
+    core.settings.dev         local development (default for manage.py)
+    core.settings.production  deployment
 
 Generated by 'django-admin startproject' using Django 6.0.2.
 
@@ -10,22 +14,15 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-jcdufuz)bs2wl#oc(p7a9$#^6-)b92wsth&go2i5psat*1hsy='
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
 
-ALLOWED_HOSTS = ['*']
+# SECRET_KEY, DEBUG and ALLOWED_HOSTS are set by each profile (dev.py / production.py)
+DEBUG = False
 
 
 # Application definition
@@ -116,11 +113,6 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
-import os
-
-# ... (keep existing STATIC_URL)
-
-# ADD THESE LINES AT THE BOTTOM
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
@@ -138,4 +130,21 @@ LOGOUT_REDIRECT_URL = 'home'
 CSRF_TRUSTED_ORIGINS = [
     'http://172.17.23.208:8000',
     'http://127.0.0.1:8000',
-]
\ No newline at end of file
+]
+
+# 3. Notifications (queued in the outbox, delivered by `manage.py send_notifications`)
+# Emails are written to files locally; the test runner swaps in the locmem backend.
+EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+DEFAULT_FROM_EMAIL = 'TurfZone <no-reply@turfzone.local>'
+NOTIFICATION_ADMIN_EMAIL = 'support@turfzone.local'
+NOTIFICATION_WEBHOOK_URL = os.environ.get('NOTIFICATION_WEBHOOK_URL', '')
+
+# 4. Profiling (TURFZONE_PROFILE=1 writes a cProfile .prof file per request)
+# Limit it to some views with TURFZONE_PROFILE_VIEWS=book_turf,operator_dashboard
+PROFILE_REQUESTS = os.environ.get('TURFZONE_PROFILE') == '1'
+PROFILE_VIEWS = [name for name in os.environ.get('TURFZONE_PROFILE_VIEWS', '').split(',') if name]
+PROFILE_DIR = BASE_DIR / 'profiles'
+
+if PROFILE_REQUESTS:
+    MIDDLEWARE.insert(0, 'core.profiling.ProfileMiddleware')
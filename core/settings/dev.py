@@ -0,0 +1,14 @@
+"""
+Local development settings. Unsuitable for production.
+See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
+"""
+
+from .base import *
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-jcdufuz)bs2wl#oc(p7a9$#^6-)b92wsth&go2i5psat*1hsy='
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = True
+
+ALLOWED_HOSTS = ['*']
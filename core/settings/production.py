@@ -0,0 +1,74 @@
+"""
+Production settings.
+
+DEBUG is off, so Django no longer keeps every SQL query in memory
+(connection.queries) and per-request memory stays flat. Templates are
+compiled once per process, and uploaded media under MEDIA_ROOT must be
+served by the web server (e.g. an nginx `location /media/` block), not Django.
+
+Required environment: DJANGO_SECRET_KEY, DJANGO_ALLOWED_HOSTS (comma separated).
+Optional: REDIS_URL for the shared cache; without it run `manage.py
+createcachetable` once so the database cache table exists.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *
+
+DEBUG = False
+
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', '')
+if not SECRET_KEY:
+    raise ImproperlyConfigured("Set DJANGO_SECRET_KEY for the production settings.")
+
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host]
+CSRF_TRUSTED_ORIGINS = [
+    origin for origin in os.environ.get('DJANGO_CSRF_TRUSTED_ORIGINS', '').split(',') if origin
+]
+
+# Templates: parse once, keep compiled in memory (APP_DIRS can't be combined with loaders)
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+# Shared cache: every worker must see the same per-tenant operator stats and
+# their signal-driven invalidation, which the default per-process locmem can't do
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'turfzone_cache',
+        }
+    }
+
+# Reuse database connections between requests
+CONN_MAX_AGE = 60
+CONN_HEALTH_CHECKS = True
+
+# Static files are collected once (collectstatic) and served by the web server
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_DIRS = [d for d in STATICFILES_DIRS if os.path.isdir(d)]
+
+# Real SMTP for the notification worker
+EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+
+# Errors only, to stderr; nothing accumulates in memory
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {'console': {'class': 'logging.StreamHandler'}},
+    'root': {'handlers': ['console'], 'level': 'WARNING'},
+}
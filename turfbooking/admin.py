@@ -1,13 +1,49 @@
 from django.contrib import admin
+from django.contrib.auth.models import User
 from django.utils.html import mark_safe
-from .models import Turf, Booking
+from .models import Turf, Booking, TurfBlackout
+
+# 0. Shared Admin Helpers (Tenancy)
+# Site-wide data (every tenant's customers): superusers only, whatever
+# model permissions an operator has been given
+class SuperuserOnlyAdmin(admin.ModelAdmin):
+    def has_module_permission(self, request):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_add_permission(self, request):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_change_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_superuser
+
+# Venue operators (non-superuser staff) only see and edit their own turfs
+class OperatorScopedAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return self.scope(qs, request.user)
+
+    def scope(self, qs, user):
+        return qs
 
 # 1. Customize the Turf Admin
-class TurfAdmin(admin.ModelAdmin):
+class TurfBlackoutInline(admin.TabularInline):
+    model = TurfBlackout
+    extra = 0
+
+class TurfAdmin(OperatorScopedAdmin):
     list_display = ('name', 'location', 'price_per_hour', 'is_residential', 'image_preview')
     list_filter = ('is_residential', 'location') # Sidebar filters
     search_fields = ('name', 'location') # Search bar at the top
     list_editable = ('price_per_hour', 'is_residential') # Edit price directly in the list
+    inlines = [TurfBlackoutInline] # Maintenance windows on the turf page
     
     # Function to show image thumbnail in admin
     def image_preview(self, obj):
@@ -16,10 +52,24 @@ class TurfAdmin(admin.ModelAdmin):
         return "No Image"
     image_preview.short_description = 'Image'
 
+    def scope(self, qs, user):
+        return qs.owned_by(user)
+
+    def get_exclude(self, request, obj=None):
+        # Only superusers hand turfs to operators
+        if request.user.is_superuser:
+            return super().get_exclude(request, obj)
+        return ('owner',)
+
+    def save_model(self, request, obj, form, change):
+        if not change and not request.user.is_superuser:
+            obj.owner = request.user
+        super().save_model(request, obj, form, change)
+
 # 2. Customize the Booking Admin
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(OperatorScopedAdmin):
     list_display = ('user', 'turf', 'date', 'start_time', 'end_time', 'status_color')
-    list_filter = ('date', 'turf')
+    list_filter = ('date', ('turf', admin.RelatedOnlyFieldListFilter))
     search_fields = ('user__username', 'turf__name')
     date_hierarchy = 'date' # visual date drill-down navigation
     
@@ -27,12 +77,39 @@ class BookingAdmin(admin.ModelAdmin):
         return mark_safe('<span style="color:green; font-weight:bold;">Confirmed</span>')
     status_color.short_description = 'Status'
 
+    def scope(self, qs, user):
+        return qs.for_operator(user)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'turf':
+            kwargs['queryset'] = Turf.objects.owned_by(request.user)
+        elif db_field.name == 'user' and not request.user.is_superuser:
+            # Only this operator's own customers, never other tenants' accounts
+            kwargs['queryset'] = User.objects.filter(
+                booking__turf__in=Turf.objects.owned_by(request.user),
+            ).distinct()
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 admin.site.register(Turf, TurfAdmin)
 admin.site.register(Booking, BookingAdmin)
-from .models import Turf, Booking, ContactMessage
+from .models import Turf, Booking, ContactMessage, TurfPriceGrid, Notification
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(SuperuserOnlyAdmin):
     list_display = ('name', 'email', 'sent_at')
     search_fields = ('name', 'email', 'message')
-    readonly_fields = ('sent_at',)
\ No newline at end of file
+    readonly_fields = ('sent_at',)
+
+@admin.register(TurfPriceGrid)
+class TurfPriceGridAdmin(SuperuserOnlyAdmin):
+    list_display = ('turf', 'date', 'generated_at')
+    list_filter = ('turf',)
+    date_hierarchy = 'date'
+    readonly_fields = ('generated_at',)
+
+@admin.register(Notification)
+class NotificationAdmin(SuperuserOnlyAdmin):
+    list_display = ('event', 'channel', 'recipient', 'status', 'attempts', 'created_at', 'sent_at')
+    list_filter = ('status', 'event', 'channel')
+    search_fields = ('recipient', 'subject')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
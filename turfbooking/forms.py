@@ -3,7 +3,6 @@ from django.contrib.auth.forms import UserCreationForm
 from .models import Booking, ContactMessage
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from datetime import datetime, timedelta
 
 # 1. Sign Up Form
 class SignUpForm(UserCreationForm):
@@ -23,7 +22,7 @@ class ContactForm(forms.ModelForm):
             'message': forms.Textarea(attrs={'rows': 4, 'placeholder': 'How can we help?', 'class': 'w-full bg-black border border-gray-700 rounded-xl px-4 py-3 text-white focus:outline-none focus:border-green-500'}),
         }
 
-# 3. Booking Form (Time-Aware + Min Duration)
+# 3. Booking Form (Time-Aware)
 class BookingForm(forms.ModelForm):
     class Meta:
         model = Booking
@@ -61,15 +60,7 @@ class BookingForm(forms.ModelForm):
         if start_time >= end_time:
             raise ValidationError("End time must be after start time.")
             
-        # 5. Minimum Duration Check (The "Minimum Time" fix)
-        # Create dummy dates to compare duration
-        dummy_date = datetime.today().date()
-        t1 = datetime.combine(dummy_date, start_time)
-        t2 = datetime.combine(dummy_date, end_time)
-        
-        duration_minutes = (t2 - t1).total_seconds() / 60
-        
-        if duration_minutes < 60:
-            raise ValidationError("Minimum booking duration is 1 hour (60 minutes).")
+        # 5. Turf rules (hours, slot size, min/max duration, blackouts) are
+        # enforced once by the turf's schedule in Booking.clean()
 
         return cleaned_data
\ No newline at end of file
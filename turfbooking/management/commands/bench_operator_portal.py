@@ -0,0 +1,115 @@
+import random
+import statistics
+import time
+from datetime import date, time as clock, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+from turfbooking.models import Booking, Turf
+from turfbooking.portal import invalidate_operator_stats
+
+
+class Command(BaseCommand):
+    help = "Benchmark the operator portal for a chain operator with many turfs (all data is rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--turfs', type=int, default=300,
+                            help="Turfs owned by the benchmarked operator.")
+        parser.add_argument('--bookings-per-turf', type=int, default=30)
+        parser.add_argument('--other-turfs', type=int, default=100,
+                            help="Turfs owned by a second tenant (must never leak into the results).")
+        parser.add_argument('--runs', type=int, default=20)
+
+    def handle(self, *args, **options):
+        # Lets us read response.context, which the leak check is built from
+        setup_test_environment(debug=settings.DEBUG)
+        try:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['testserver']):
+                operator = self.seed(options)
+                self.run(operator, options)
+                transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+    # 1. Fake tenants
+    def seed(self, options):
+        operator = User.objects.create_user('bench-operator', is_staff=True)
+        other = User.objects.create_user('bench-other', is_staff=True)
+        player = User.objects.create_user('bench-player')
+
+        turfs = Turf.objects.bulk_create(
+            [Turf(owner=operator, name=f"Bench Turf {i}", location="Bench City", price_per_hour=1000)
+             for i in range(options['turfs'])]
+            + [Turf(owner=other, name=f"Other Turf {i}", location="Elsewhere", price_per_hour=1000)
+               for i in range(options['other_turfs'])]
+        )
+
+        rng = random.Random(42)
+        today = date.today()
+        bookings = []
+        for turf in turfs:
+            for i in range(options['bookings_per_turf']):
+                hour = 6 + i % 16
+                status = rng.choice(['CONFIRMED', 'CONFIRMED', 'PENDING', 'CANCELLED'])
+                bookings.append(Booking(
+                    user=player, turf=turf,
+                    date=today + timedelta(days=rng.randint(-30, 30)),
+                    start_time=clock(hour), end_time=clock(hour + 1),
+                    total_price=Decimal('1000.00'),
+                    refund_amount=Decimal('500.00') if status == 'CANCELLED' else Decimal('0.00'),
+                    status=status,
+                ))
+        Booking.objects.bulk_create(bookings, batch_size=1000)
+        return operator
+
+    # 2. Measurements
+    def run(self, operator, options):
+        client = Client()
+        client.force_login(operator)
+        url = reverse('operator_dashboard')
+
+        cold, warm = [], []
+        for _ in range(options['runs']):
+            invalidate_operator_stats(operator.id)
+            with CaptureQueriesContext(connection) as cold_queries:
+                start = time.perf_counter()
+                self.check_response(client.get(url))
+                cold.append((time.perf_counter() - start) * 1000)
+
+            with CaptureQueriesContext(connection) as warm_queries:
+                start = time.perf_counter()
+                response = self.check_response(client.get(url))
+                warm.append((time.perf_counter() - start) * 1000)
+
+        self.stdout.write(f"Cold (cache miss): median {statistics.median(cold):.1f} ms, {len(cold_queries)} queries")
+        self.stdout.write(f"Warm (cache hit):  median {statistics.median(warm):.1f} ms, {len(warm_queries)} queries")
+
+        # 3. Tenant isolation, judged on what the view actually served
+        totals = response.context['totals']
+        turf_stats = response.context['turf_stats']
+        expected = options['turfs'] * options['bookings_per_turf']
+        seen = totals['confirmed'] + totals['pending'] + totals['cancellations']
+        foreign = [row['name'] for row in turf_stats if not row['name'].startswith("Bench Turf")]
+        foreign += [b.turf.name for b in response.context['upcoming'] if not b.turf.name.startswith("Bench Turf")]
+
+        self.stdout.write(f"Operator turfs served: {len(turf_stats)} (bookings counted {seen}/{expected})")
+        if totals['turfs'] != options['turfs'] or len(turf_stats) != options['turfs'] or seen != expected or foreign:
+            raise CommandError("Tenant scoping leaked another operator's data!")
+        self.stdout.write(self.style.SUCCESS("Tenant scoping OK."))
+
+    def check_response(self, response):
+        if response.status_code != 200:
+            raise CommandError(f"Operator dashboard returned {response.status_code}")
+        return response
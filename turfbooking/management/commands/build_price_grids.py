@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from turfbooking.models import Turf
+from turfbooking.pricing import (
+    DEFAULT_HORIZON_DAYS,
+    DEFAULT_LOOKBACK_DAYS,
+    rebuild_price_grids,
+)
+
+
+class Command(BaseCommand):
+    help = "Precompute demand-based price grids for upcoming days (run nightly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=DEFAULT_HORIZON_DAYS,
+                            help="How many days ahead to build grids for.")
+        parser.add_argument('--lookback', type=int, default=DEFAULT_LOOKBACK_DAYS,
+                            help="How many past days of CONFIRMED bookings to learn demand from.")
+        parser.add_argument('--turf', type=int, action='append', dest='turf_ids',
+                            help="Only rebuild this turf id (can be repeated).")
+
+    def handle(self, *args, **options):
+        turfs = Turf.objects.all()
+        if options['turf_ids']:
+            turfs = turfs.filter(id__in=options['turf_ids'])
+
+        written = rebuild_price_grids(
+            turfs=turfs,
+            horizon_days=options['days'],
+            lookback_days=options['lookback'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Built {written} price grids."))
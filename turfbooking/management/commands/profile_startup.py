@@ -0,0 +1,72 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs django.setup() in a fresh interpreter so nothing is already imported
+SETUP_SCRIPT = (
+    "import time; t = time.perf_counter(); import django; django.setup(); "
+    "print(round((time.perf_counter() - t) * 1000, 1))"
+)
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+class Command(BaseCommand):
+    help = "Report import/startup time per installed app (uses python -X importtime)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10,
+                            help="Also list the N slowest individual modules.")
+        parser.add_argument('--raw', help="Write the raw -X importtime log to this file.")
+
+    def handle(self, *args, **options):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', SETUP_SCRIPT],
+            capture_output=True, text=True, env=os.environ.copy(),
+            cwd=settings.BASE_DIR,
+        )
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            raise CommandError(lines[-1] if lines else f"django.setup() exited with code {result.returncode}")
+
+        if options['raw']:
+            with open(options['raw'], 'w') as f:
+                f.write(result.stderr)
+
+        # 1. Attribute every module's own import time to the app that owns it
+        apps = sorted(settings.INSTALLED_APPS, key=len, reverse=True)
+        per_app = defaultdict(int)
+        modules = []
+        for line in result.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if not match:
+                continue
+            self_us, module = int(match.group(1)), match.group(4)
+            modules.append((self_us, module))
+            per_app[self.owner(module, apps)] += self_us
+
+        # 2. Report
+        self.stdout.write(f"django.setup() took {result.stdout.strip()} ms "
+                          f"({settings.SETTINGS_MODULE})\n")
+        self.stdout.write(f"{'App':<40}{'Import ms':>10}")
+        for app, us in sorted(per_app.items(), key=lambda item: -item[1]):
+            self.stdout.write(f"{app:<40}{us / 1000:>10.1f}")
+
+        if options['top']:
+            self.stdout.write("\nSlowest modules (self time):")
+            for us, module in sorted(modules, reverse=True)[:options['top']]:
+                self.stdout.write(f"{module:<60}{us / 1000:>8.1f} ms")
+
+    def owner(self, module, apps):
+        for app in apps:
+            if module == app or module.startswith(app + '.'):
+                return app
+        if module == 'django' or module.startswith('django.'):
+            return 'django (framework)'
+        if module.startswith('core'):
+            return 'core (project)'
+        return 'stdlib / third-party'
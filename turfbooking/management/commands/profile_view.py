@@ -0,0 +1,72 @@
+import cProfile
+import io
+import pstats
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import NoReverseMatch, reverse
+
+
+class Command(BaseCommand):
+    help = "cProfile a view by URL name and write a .prof file (pstats / snakeviz / flameprof)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('view', help="URL name, e.g. book_turf or operator_dashboard.")
+        parser.add_argument('kwargs', nargs='*', help="URL kwargs as key=value, e.g. turf_id=1.")
+        parser.add_argument('--user', help="Log in as this username first.")
+        parser.add_argument('--requests', type=int, default=20,
+                            help="How many GETs to profile (the first one warms caches and isn't counted).")
+        parser.add_argument('--output', help="Where to write the .prof file.")
+        parser.add_argument('--top', type=int, default=20)
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError("--requests must be at least 1.")
+
+        if any('=' not in item for item in options['kwargs']):
+            raise CommandError("URL kwargs must be key=value")
+        url_kwargs = dict(item.split('=', 1) for item in options['kwargs'])
+        try:
+            url = reverse(options['view'], kwargs=url_kwargs or None)
+        except NoReverseMatch as e:
+            raise CommandError(e)
+
+        client = Client()
+        if options['user']:
+            try:
+                client.force_login(User.objects.get(username=options['user']))
+            except User.DoesNotExist:
+                raise CommandError(f"No user named {options['user']}")
+
+        output = Path(options['output'] or settings.PROFILE_DIR / f"{options['view']}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            # Warm-up request: imports, template compilation, cache fill
+            response = client.get(url)
+            # Anything but a 2xx (e.g. a redirect to the login page) would profile the wrong view
+            if not 200 <= response.status_code < 300:
+                hint = "" if options['user'] else " (pass --user for views that need a login)"
+                raise CommandError(f"GET {url} returned {response.status_code}{hint}")
+
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            for _ in range(options['requests']):
+                client.get(url)
+            profiler.disable()
+            elapsed = (time.perf_counter() - start) * 1000
+
+        profiler.dump_stats(output)
+        self.stdout.write(f"GET {url} x{options['requests']}: {elapsed / options['requests']:.1f} ms/request "
+                          f"(DEBUG={settings.DEBUG})")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
+
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(options['top'])
+        self.stdout.write(report.getvalue())
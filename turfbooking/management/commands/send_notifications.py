@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from turfbooking.notifications import DEFAULT_BATCH_SIZE, DEFAULT_WORKERS, drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver pending booking/contact notifications from the outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help="How many notifications to claim per batch.")
+        parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                            help="Size of the delivery thread pool.")
+        parser.add_argument('--loop', action='store_true',
+                            help="Keep polling instead of exiting once the outbox is empty.")
+        parser.add_argument('--interval', type=float, default=5.0,
+                            help="Seconds to sleep between polls when the outbox is empty (with --loop).")
+
+    def handle(self, *args, **options):
+        total_sent = total_retrying = total_failed = 0
+
+        while True:
+            sent, retrying, failed = drain_outbox(options['batch_size'], options['workers'])
+            total_sent += sent
+            total_retrying += retrying
+            total_failed += failed
+
+            if sent or retrying or failed:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {total_sent} notifications, {total_retrying} will be retried, "
+            f"{total_failed} failed permanently."
+        ))
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('turfbooking', '0002_booking_refund_amount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TurfPriceGrid',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('multipliers', models.BinaryField()),
+                ('generated_at', models.DateTimeField(auto_now=True)),
+                ('turf', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='price_grids', to='turfbooking.turf')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('turf', 'date'), name='unique_price_grid_per_turf_day')],
+            },
+        ),
+    ]
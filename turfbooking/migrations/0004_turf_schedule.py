@@ -0,0 +1,54 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:39
+
+import datetime
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('turfbooking', '0003_turfpricegrid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turf',
+            name='closing_time',
+            field=models.TimeField(default=datetime.time(23, 0)),
+        ),
+        migrations.AddField(
+            model_name='turf',
+            name='max_duration_minutes',
+            field=models.PositiveSmallIntegerField(default=240),
+        ),
+        migrations.AddField(
+            model_name='turf',
+            name='min_duration_minutes',
+            field=models.PositiveSmallIntegerField(default=60),
+        ),
+        migrations.AddField(
+            model_name='turf',
+            name='opening_time',
+            field=models.TimeField(default=datetime.time(6, 0)),
+        ),
+        migrations.AddField(
+            model_name='turf',
+            name='slot_minutes',
+            field=models.PositiveSmallIntegerField(default=15),
+        ),
+        migrations.CreateModel(
+            name='TurfBlackout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('reason', models.CharField(blank=True, max_length=200)),
+                ('turf', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='blackouts', to='turfbooking.turf')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['turf', 'date'], name='turfbooking_turf_id_6985ca_idx')],
+            },
+        ),
+    ]
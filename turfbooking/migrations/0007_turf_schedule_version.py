@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-19 16:48
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('turfbooking', '0006_turf_owner'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turf',
+            name='schedule_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='turf',
+            name='max_duration_minutes',
+            field=models.PositiveSmallIntegerField(default=240, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AlterField(
+            model_name='turf',
+            name='min_duration_minutes',
+            field=models.PositiveSmallIntegerField(default=60, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AlterField(
+            model_name='turf',
+            name='slot_minutes',
+            field=models.PositiveSmallIntegerField(default=15, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+    ]
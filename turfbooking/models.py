@@ -1,20 +1,90 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 from django.utils import timezone
-from datetime import timedelta, datetime, date
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from datetime import timedelta, datetime, time
+
+from .pricing import quote_price
+from .schedule import get_schedule
+from .portal import invalidate_operator_stats
+
+# 0. TENANT SCOPING (Venue operators only ever see their own turfs)
+class TurfQuerySet(models.QuerySet):
+    def owned_by(self, user):
+        if user.is_superuser:
+            return self
+        return self.filter(owner=user)
+
+class BookingQuerySet(models.QuerySet):
+    def for_operator(self, user):
+        if user.is_superuser:
+            return self
+        return self.filter(turf__owner=user)
 
 # 1. TURF MODEL
 class Turf(models.Model):
+    owner = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='owned_turfs')
     name = models.CharField(max_length=100)
     location = models.CharField(max_length=200)
     image = models.ImageField(upload_to='turfs/', blank=True, null=True)
     is_residential = models.BooleanField(default=False)
     price_per_hour = models.DecimalField(max_digits=6, decimal_places=2)
-    
+
+    # Operating rules (compiled into a cached TurfSchedule, see schedule.py)
+    opening_time = models.TimeField(default=time(6, 0))
+    closing_time = models.TimeField(default=time(23, 0))
+    slot_minutes = models.PositiveSmallIntegerField(default=15, validators=[MinValueValidator(1)])
+    min_duration_minutes = models.PositiveSmallIntegerField(default=60, validators=[MinValueValidator(1)])
+    max_duration_minutes = models.PositiveSmallIntegerField(default=240, validators=[MinValueValidator(1)])
+    # Bumped on every turf save and blackout change. It's part of the schedule
+    # cache key, so every worker picks up new rules on its next request.
+    schedule_version = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = TurfQuerySet.as_manager()
+
+    def clean(self):
+        if self.opening_time and self.closing_time and self.opening_time >= self.closing_time:
+            raise ValidationError("Closing time must be after opening time.")
+        if not (self.slot_minutes and self.min_duration_minutes and self.max_duration_minutes):
+            raise ValidationError("Slot size and durations must be at least 1 minute.")
+        if self.min_duration_minutes > self.max_duration_minutes:
+            raise ValidationError("Minimum duration can't be longer than maximum duration.")
+        if self.min_duration_minutes % self.slot_minutes or self.max_duration_minutes % self.slot_minutes:
+            raise ValidationError("Durations must be a multiple of the slot size.")
+
+    def save(self, *args, **kwargs):
+        # Bump the version in SQL so a stale in-memory copy can't roll it back
+        bump = not self._state.adding
+        if bump:
+            self.schedule_version = models.F('schedule_version') + 1
+        super().save(*args, **kwargs)
+        if bump:
+            self.refresh_from_db(fields=['schedule_version'])
+
     def __str__(self):
         return self.name
 
+# 1b. BLACKOUT WINDOWS (Maintenance, private events...)
+class TurfBlackout(models.Model):
+    turf = models.ForeignKey(Turf, on_delete=models.CASCADE, related_name='blackouts')
+    date = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    reason = models.CharField(max_length=200, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['turf', 'date'])]
+
+    def clean(self):
+        if self.start_time and self.end_time and self.start_time >= self.end_time:
+            raise ValidationError("End time must be after start time.")
+
+    def __str__(self):
+        return f"{self.turf.name} closed {self.date} {self.start_time}-{self.end_time}"
+
 # 2. CONTACT MESSAGE MODEL
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
@@ -25,6 +95,61 @@ class ContactMessage(models.Model):
     def __str__(self):
         return f"Message from {self.name}"
 
+# 2b. DEMAND PRICE GRID (Precomputed by `manage.py build_price_grids`)
+class TurfPriceGrid(models.Model):
+    turf = models.ForeignKey(Turf, on_delete=models.CASCADE, related_name='price_grids')
+    date = models.DateField()
+    # One byte per 15-minute slot: percentage of turf.price_per_hour.
+    # Fixed size whatever turf.slot_minutes is (see pricing.py).
+    multipliers = models.BinaryField()
+    generated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['turf', 'date'], name='unique_price_grid_per_turf_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.turf.name} prices for {self.date}"
+
+# 2c. NOTIFICATION OUTBOX (Drained by `manage.py send_notifications`)
+class Notification(models.Model):
+    EVENT_CHOICES = [
+        ('BOOKING_CONFIRMED', 'Booking Confirmed'),
+        ('BOOKING_CANCELLED', 'Booking Cancelled'),
+        ('CONTACT_RECEIVED', 'Contact Message Received'),
+    ]
+    CHANNEL_CHOICES = [
+        ('EMAIL', 'Email'),
+        ('WEBHOOK', 'Webhook'),
+    ]
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed'),
+    ]
+
+    event = models.CharField(max_length=20, choices=EVENT_CHOICES)
+    channel = models.CharField(max_length=10, choices=CHANNEL_CHOICES, default='EMAIL')
+    recipient = models.CharField(max_length=254) # Email address or webhook URL
+    subject = models.CharField(max_length=200)
+    body = models.TextField()
+
+    # Delivery state
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+
+    def __str__(self):
+        return f"{self.get_event_display()} -> {self.recipient} ({self.status})"
+
 # 3. BOOKING MODEL (The Core Logic)
 class Booking(models.Model):
     STATUS_CHOICES = [
@@ -46,6 +171,11 @@ class Booking(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BookingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [models.Index(fields=['turf', 'date', 'status'])]
+
     # --- 1. CLASH DETECTION ---
     def clean(self):
         # Basic Validation
@@ -57,6 +187,10 @@ class Booking(models.Model):
         except Exception:
             return
 
+        # Turf Rules (hours, slot size, duration, blackouts)
+        if self.date and self.start_time and self.end_time:
+            get_schedule(current_turf).validate(self.date, self.start_time, self.end_time)
+
         # Conflict Check (Blocks Confirmed & Pending)
         overlapping_bookings = Booking.objects.filter(
             turf=current_turf,
@@ -108,13 +242,47 @@ class Booking(models.Model):
             return 0.00, "0% (Last Minute Cancellation)"
 
     def save(self, *args, **kwargs):
-        # Auto-calculate Price on Save
-        if self.start_time and self.end_time and self.turf:
-            t1 = datetime.combine(date.today(), self.start_time)
-            t2 = datetime.combine(date.today(), self.end_time)
-            duration_hours = (t2 - t1).seconds / 3600
-            self.total_price = round(float(self.turf.price_per_hour) * duration_hours, 2)
+        # Auto-calculate Price when the booking is created.
+        # The quoted price is locked in, so later saves (payment, cancellation)
+        # don't pick up a re-generated price grid.
+        if self._state.adding and self.start_time and self.end_time and self.turf:
+            self.total_price = quote_price(self.turf, self.date, self.start_time, self.end_time)
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"{self.user.username} - {self.turf.name} ({self.status})"
\ No newline at end of file
+        return f"{self.user.username} - {self.turf.name} ({self.status})"
+
+
+# --- CACHE INVALIDATION ---
+# Turf.save() bumps schedule_version itself; blackouts bump it for their turf.
+@receiver(pre_save, sender=Turf)
+def remember_previous_owner(sender, instance, **kwargs):
+    # A turf moved to a new owner must also drop off the old owner's dashboard
+    instance._previous_owner_id = None
+    if instance.pk:
+        instance._previous_owner_id = (
+            Turf.objects.filter(pk=instance.pk).values_list('owner_id', flat=True).first()
+        )
+
+@receiver(post_save, sender=Turf)
+@receiver(post_delete, sender=Turf)
+def turf_changed_invalidate_stats(sender, instance, **kwargs):
+    invalidate_operator_stats(instance.owner_id)
+    previous_owner_id = getattr(instance, '_previous_owner_id', None)
+    if previous_owner_id != instance.owner_id:
+        invalidate_operator_stats(previous_owner_id)
+
+@receiver(post_save, sender=TurfBlackout)
+@receiver(post_delete, sender=TurfBlackout)
+def turf_blackout_changed(sender, instance, **kwargs):
+    Turf.objects.filter(id=instance.turf_id).update(schedule_version=models.F('schedule_version') + 1)
+
+# Any booking change shows up on the turf owner's operator dashboard.
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def booking_changed(sender, instance, **kwargs):
+    try:
+        owner_id = instance.turf.owner_id
+    except Turf.DoesNotExist:
+        return
+    invalidate_operator_stats(owner_id)
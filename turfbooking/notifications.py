@@ -0,0 +1,175 @@
+import json
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+# --- NOTIFICATION OUTBOX ---
+# Views never send anything themselves. They write Notification rows in the
+# same transaction as the booking/contact change, and `manage.py
+# send_notifications` delivers them in batches from a thread pool, retrying
+# failures with exponential backoff.
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_WORKERS = 4
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 30
+# A claimed row is hidden from other workers for this long. If a worker dies
+# mid-batch the row simply becomes due again once the lease runs out.
+LEASE_SECONDS = 300
+WEBHOOK_TIMEOUT = 10
+
+
+# 1. Enqueue (call inside the view's transaction)
+def _enqueue(event, recipient, subject, body):
+    from .models import Notification
+
+    rows = []
+    if recipient:
+        rows.append(Notification(
+            event=event, channel='EMAIL', recipient=recipient, subject=subject, body=body,
+        ))
+
+    webhook_url = getattr(settings, 'NOTIFICATION_WEBHOOK_URL', '')
+    if webhook_url:
+        rows.append(Notification(
+            event=event, channel='WEBHOOK', recipient=webhook_url, subject=subject, body=body,
+        ))
+
+    if rows:
+        Notification.objects.bulk_create(rows)
+    return rows
+
+
+def notify_booking_confirmed(booking):
+    subject = f"Booking confirmed: {booking.turf.name} on {booking.date}"
+    body = (
+        f"Hi {booking.user.username},\n\n"
+        f"Your booking at {booking.turf.name} on {booking.date} from "
+        f"{booking.start_time:%H:%M} to {booking.end_time:%H:%M} is confirmed.\n"
+        f"Amount paid: ₹{booking.total_price}\n\nGame On!"
+    )
+    return _enqueue('BOOKING_CONFIRMED', booking.user.email, subject, body)
+
+
+def notify_booking_cancelled(booking, reason):
+    subject = f"Booking cancelled: {booking.turf.name} on {booking.date}"
+    body = (
+        f"Hi {booking.user.username},\n\n"
+        f"Your booking at {booking.turf.name} on {booking.date} from "
+        f"{booking.start_time:%H:%M} to {booking.end_time:%H:%M} has been cancelled.\n"
+        f"Refund: ₹{booking.refund_amount} ({reason})"
+    )
+    return _enqueue('BOOKING_CANCELLED', booking.user.email, subject, body)
+
+
+def notify_contact_received(contact_message):
+    subject = f"New contact message from {contact_message.name}"
+    body = (
+        f"From: {contact_message.name} <{contact_message.email}>\n\n"
+        f"{contact_message.message}"
+    )
+    return _enqueue('CONTACT_RECEIVED', settings.NOTIFICATION_ADMIN_EMAIL, subject, body)
+
+
+# 2. Delivery (one call per notification, runs on a worker thread)
+def _deliver(notification):
+    if notification.channel == 'WEBHOOK':
+        payload = json.dumps({
+            'event': notification.event,
+            'subject': notification.subject,
+            'body': notification.body,
+        }).encode()
+        request = urllib.request.Request(
+            notification.recipient,
+            data=payload,
+            headers={'Content-Type': 'application/json'},
+        )
+        with urllib.request.urlopen(request, timeout=WEBHOOK_TIMEOUT):
+            pass
+        return
+
+    connection = get_connection()
+    EmailMessage(
+        subject=notification.subject,
+        body=notification.body,
+        to=[notification.recipient],
+        connection=connection,
+    ).send()
+
+
+def _try_deliver(notification):
+    """
+    Returns (notification, error). error is None on success.
+    """
+    try:
+        _deliver(notification)
+        return notification, None
+    except Exception as e:
+        return notification, f"{type(e).__name__}: {e}"
+
+
+# 3. Worker
+def claim_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Picks due notifications and leases them to this worker.
+    """
+    from .models import Notification
+
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            Notification.objects.select_for_update(skip_locked=True)
+            .filter(status='PENDING', next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:batch_size]
+        )
+        if batch:
+            Notification.objects.filter(id__in=[n.id for n in batch]).update(
+                next_attempt_at=now + timedelta(seconds=LEASE_SECONDS),
+            )
+    return batch
+
+
+def drain_outbox(batch_size=DEFAULT_BATCH_SIZE, workers=DEFAULT_WORKERS):
+    """
+    Sends one batch. Returns (sent, retrying, failed) counts, where failed
+    means the row used its last attempt and won't be retried.
+    """
+    from .models import Notification
+
+    batch = claim_batch(batch_size)
+    if not batch:
+        return 0, 0, 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_try_deliver, batch))
+
+    # Bookkeeping happens back on this thread, not in the pool
+    now = timezone.now()
+    sent = retrying = failed = 0
+    for notification, error in results:
+        notification.attempts += 1
+        if error is None:
+            notification.status = 'SENT'
+            notification.sent_at = now
+            notification.last_error = ''
+            sent += 1
+        else:
+            notification.last_error = error
+            if notification.attempts >= MAX_ATTEMPTS:
+                notification.status = 'FAILED'
+                failed += 1
+            else:
+                delay = BACKOFF_SECONDS * 2 ** (notification.attempts - 1)
+                notification.next_attempt_at = now + timedelta(seconds=delay)
+                retrying += 1
+
+    Notification.objects.bulk_update(
+        [notification for notification, _ in results],
+        ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at'],
+    )
+    return sent, retrying, failed
@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import Case, Count, DecimalField, F, Q, Sum, When
+
+# --- OPERATOR PORTAL ---
+# Per-tenant dashboard numbers. Everything is computed with one grouped query
+# over the operator's turfs and cached per operator until one of their turfs
+# or bookings changes (see the signal receivers at the bottom of models.py).
+# Superusers see every turf, which no single owner's invalidation covers, so
+# their stats are always computed fresh.
+
+CACHE_KEY = 'operator-stats:{}'
+CACHE_TIMEOUT = 5 * 60
+
+# Money we actually keep: confirmed bookings in full, cancelled ones minus refund
+REVENUE = Sum(
+    Case(
+        When(booking__status='CONFIRMED', then=F('booking__total_price')),
+        When(booking__status='CANCELLED', then=F('booking__total_price') - F('booking__refund_amount')),
+        default=Decimal('0.00'),
+        output_field=DecimalField(max_digits=12, decimal_places=2),
+    )
+)
+
+
+def compute_operator_stats(user):
+    from .models import Turf
+
+    turfs = list(
+        Turf.objects.owned_by(user)
+        .annotate(
+            confirmed=Count('booking', filter=Q(booking__status='CONFIRMED')),
+            pending=Count('booking', filter=Q(booking__status='PENDING')),
+            cancellations=Count('booking', filter=Q(booking__status='CANCELLED')),
+            refunded=Sum('booking__refund_amount', filter=Q(booking__status='CANCELLED')),
+            revenue=REVENUE,
+        )
+        .order_by('-revenue', 'name')
+        .values('id', 'name', 'location', 'price_per_hour',
+                'confirmed', 'pending', 'cancellations', 'refunded', 'revenue')
+    )
+
+    totals = {'turfs': len(turfs), 'confirmed': 0, 'pending': 0, 'cancellations': 0,
+              'refunded': Decimal('0.00'), 'revenue': Decimal('0.00')}
+    for row in turfs:
+        row['refunded'] = row['refunded'] or Decimal('0.00')
+        row['revenue'] = row['revenue'] or Decimal('0.00')
+        for key in ('confirmed', 'pending', 'cancellations', 'refunded', 'revenue'):
+            totals[key] += row[key]
+
+    return {'totals': totals, 'turfs': turfs}
+
+
+def get_operator_stats(user):
+    if user.is_superuser:
+        return compute_operator_stats(user)
+
+    key = CACHE_KEY.format(user.id)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_operator_stats(user)
+        cache.set(key, stats, CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_operator_stats(owner_id):
+    if owner_id is not None:
+        cache.delete(CACHE_KEY.format(owner_id))
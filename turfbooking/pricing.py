@@ -0,0 +1,191 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import transaction
+
+# --- DEMAND PRICING ---
+# Every turf gets one price grid per day. A grid is a row of multipliers,
+# one per slot, stored as raw bytes (1 byte = 1 slot = a percentage of
+# price_per_hour). Grids are rebuilt in batch by `manage.py build_price_grids`,
+# so the booking flow only ever does a single indexed row lookup.
+#
+# The grid granularity is fixed and deliberately independent of
+# Turf.slot_minutes: every grid is the same 96 bytes no matter how a turf's
+# rules change, so editing slot_minutes never invalidates stored grids.
+# quote_price() prorates by overlapping minutes, so any booking length
+# (30, 45, 60 minute slots...) is priced exactly from the 15-minute rows.
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = (24 * 60) // SLOT_MINUTES
+
+# Demand curve: a slot booked on TARGET_OCCUPANCY of past same-weekdays
+# stays at base price, busier slots go up, quieter slots go down.
+BASE_PERCENT = 100
+MIN_PERCENT = 80
+MAX_PERCENT = 150
+TARGET_OCCUPANCY = 0.5
+SURGE_FACTOR = 1.0
+
+DEFAULT_LOOKBACK_DAYS = 28
+DEFAULT_HORIZON_DAYS = 14
+
+
+# 1. Encoding helpers
+def encode_grid(percents):
+    return bytes(percents)
+
+
+def decode_grid(raw):
+    if raw is None:
+        return None
+    return bytes(raw)
+
+
+def _to_minutes(t):
+    return t.hour * 60 + t.minute
+
+
+def _percent_for(occupancy):
+    percent = BASE_PERCENT + round((occupancy - TARGET_OCCUPANCY) * SURGE_FACTOR * 100)
+    return max(MIN_PERCENT, min(MAX_PERCENT, percent))
+
+
+# 2. Read side (used by Booking.save and book_turf)
+def get_grid(turf, day):
+    from .models import TurfPriceGrid
+
+    raw = (
+        TurfPriceGrid.objects.filter(turf=turf, date=day)
+        .values_list('multipliers', flat=True)
+        .first()
+    )
+    return decode_grid(raw)
+
+
+def get_grids(turf, start_day, days):
+    """
+    Returns {date: grid_bytes} for a window of days in one query.
+    """
+    from .models import TurfPriceGrid
+
+    rows = TurfPriceGrid.objects.filter(
+        turf=turf,
+        date__gte=start_day,
+        date__lt=start_day + timedelta(days=days),
+    ).values_list('date', 'multipliers')
+    return {day: decode_grid(raw) for day, raw in rows}
+
+
+def quote_price(turf, day, start_time, end_time, grid=None):
+    """
+    Price of a booking from start_time to end_time on a given day.
+    Falls back to the flat price_per_hour when no grid exists.
+    """
+    if grid is None:
+        grid = get_grid(turf, day)
+
+    base = Decimal(str(turf.price_per_hour))
+    start_min = _to_minutes(start_time)
+    end_min = _to_minutes(end_time)
+
+    if not grid:
+        total = base * Decimal(end_min - start_min) / 60
+        return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+    # Weight each slot's multiplier by how many minutes of it are booked
+    weighted = 0
+    slot = start_min // SLOT_MINUTES
+    while slot * SLOT_MINUTES < end_min:
+        slot_start = slot * SLOT_MINUTES
+        overlap = min(end_min, slot_start + SLOT_MINUTES) - max(start_min, slot_start)
+        weighted += grid[slot] * overlap
+        slot += 1
+
+    total = base * Decimal(weighted) / (60 * 100)
+    return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+# 3. Write side (batch job)
+def compute_occupancy(turfs, today, lookback_days=DEFAULT_LOOKBACK_DAYS):
+    """
+    Returns {turf_id: {weekday: [occupancy per slot]}} from CONFIRMED
+    bookings in the last `lookback_days` days.
+    """
+    from .models import Booking
+
+    window_start = today - timedelta(days=lookback_days)
+
+    # How many of each weekday fall inside the window
+    weekday_counts = defaultdict(int)
+    for offset in range(lookback_days):
+        weekday_counts[(window_start + timedelta(days=offset)).weekday()] += 1
+
+    counts = defaultdict(lambda: defaultdict(lambda: [0] * SLOTS_PER_DAY))
+    bookings = Booking.objects.filter(
+        turf__in=turfs,
+        status='CONFIRMED',
+        date__gte=window_start,
+        date__lt=today,
+    ).values_list('turf_id', 'date', 'start_time', 'end_time')
+
+    for turf_id, day, start_time, end_time in bookings.iterator():
+        row = counts[turf_id][day.weekday()]
+        first = _to_minutes(start_time) // SLOT_MINUTES
+        last = -(-_to_minutes(end_time) // SLOT_MINUTES)
+        for slot in range(first, min(last, SLOTS_PER_DAY)):
+            row[slot] += 1
+
+    occupancy = {}
+    for turf_id, by_weekday in counts.items():
+        occupancy[turf_id] = {
+            weekday: [min(1.0, c / weekday_counts[weekday]) for c in row]
+            for weekday, row in by_weekday.items()
+        }
+    return occupancy
+
+
+def build_grid(occupancy_row):
+    if occupancy_row is None:
+        occupancy_row = [TARGET_OCCUPANCY] * SLOTS_PER_DAY
+    return encode_grid(_percent_for(o) for o in occupancy_row)
+
+
+def rebuild_price_grids(turfs=None, today=None,
+                        horizon_days=DEFAULT_HORIZON_DAYS,
+                        lookback_days=DEFAULT_LOOKBACK_DAYS):
+    """
+    Precomputes grids for every turf from today up to `horizon_days` ahead
+    and drops grids for past dates. Returns the number of grids written.
+    """
+    from .models import Turf, TurfPriceGrid
+
+    if turfs is None:
+        turfs = Turf.objects.all()
+    if today is None:
+        today = date.today()
+
+    turfs = list(turfs)
+    occupancy = compute_occupancy(turfs, today, lookback_days)
+    days = [today + timedelta(days=offset) for offset in range(horizon_days)]
+
+    grids = []
+    for turf in turfs:
+        by_weekday = occupancy.get(turf.id, {})
+        for day in days:
+            row = by_weekday.get(day.weekday())
+            # A turf with history but nothing on this weekday is genuinely quiet
+            if row is None and by_weekday:
+                row = [0.0] * SLOTS_PER_DAY
+            grids.append(TurfPriceGrid(
+                turf=turf,
+                date=day,
+                multipliers=build_grid(row),
+            ))
+
+    with transaction.atomic():
+        TurfPriceGrid.objects.filter(turf__in=turfs, date__lt=today).delete()
+        TurfPriceGrid.objects.filter(turf__in=turfs, date__in=days).delete()
+        TurfPriceGrid.objects.bulk_create(grids, batch_size=500)
+
+    return len(grids)
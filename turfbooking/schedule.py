@@ -0,0 +1,99 @@
+from collections import defaultdict
+from datetime import date
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+# --- TURF SCHEDULE ---
+# Operating hours, slot size, duration limits and blackouts compiled into a
+# single object per turf. The booking page and server-side validation both
+# read from it, and it's cached so a request never re-queries the rules.
+#
+# The cache key carries turf.schedule_version, read from the Turf row the
+# request already loaded. Any rule or blackout change bumps the version, so
+# every worker misses the cache on its next request, whatever the backend.
+
+CACHE_KEY = 'turf-schedule:{}:v{}'
+CACHE_TIMEOUT = 60 * 60
+
+
+def _to_minutes(t):
+    return t.hour * 60 + t.minute
+
+
+def _to_time_str(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class TurfSchedule:
+    def __init__(self, turf, blackouts=()):
+        self.turf_id = turf.id
+        self.opens = _to_minutes(turf.opening_time)
+        self.closes = _to_minutes(turf.closing_time)
+        self.step = turf.slot_minutes
+        self.min_duration = turf.min_duration_minutes
+        self.max_duration = turf.max_duration_minutes
+
+        # {date: [(start_min, end_min), ...]}
+        self.blackouts = defaultdict(list)
+        for day, start_time, end_time in blackouts:
+            self.blackouts[day].append((_to_minutes(start_time), _to_minutes(end_time)))
+        self.blackouts = dict(self.blackouts)
+
+    # 1. Server-side validation (called from Booking.clean)
+    def validate(self, day, start_time, end_time):
+        start = _to_minutes(start_time)
+        end = _to_minutes(end_time)
+
+        if start < self.opens or end > self.closes:
+            raise ValidationError(
+                f"This turf is open from {_to_time_str(self.opens)} to {_to_time_str(self.closes)}."
+            )
+
+        if (start - self.opens) % self.step or (end - start) % self.step:
+            raise ValidationError(f"Bookings must be made in {self.step}-minute slots.")
+
+        duration = end - start
+        if duration < self.min_duration:
+            raise ValidationError(f"Minimum booking duration is {self.min_duration} minutes.")
+        if duration > self.max_duration:
+            raise ValidationError(f"Maximum booking duration is {self.max_duration} minutes.")
+
+        for blocked_start, blocked_end in self.blackouts.get(day, ()):
+            if start < blocked_end and end > blocked_start:
+                raise ValidationError("This slot is blocked for maintenance.")
+
+    # 2. Payload for the booking page JavaScript
+    def to_payload(self):
+        return {
+            'opens': self.opens,
+            'closes': self.closes,
+            'step': self.step,
+            'min_duration': self.min_duration,
+            'max_duration': self.max_duration,
+            'blackouts': [
+                {'date': day, 'start_time': _to_time_str(s), 'end_time': _to_time_str(e)}
+                for day, windows in sorted(self.blackouts.items())
+                for s, e in windows
+            ],
+        }
+
+
+# 3. Cached access
+def get_schedule(turf):
+    key = CACHE_KEY.format(turf.id, turf.schedule_version)
+    schedule = cache.get(key)
+    if schedule is None:
+        schedule = compile_schedule(turf)
+        cache.set(key, schedule, CACHE_TIMEOUT)
+    return schedule
+
+
+def compile_schedule(turf):
+    from .models import TurfBlackout
+
+    blackouts = TurfBlackout.objects.filter(
+        turf=turf,
+        date__gte=date.today(),
+    ).values_list('date', 'start_time', 'end_time')
+    return TurfSchedule(turf, blackouts)
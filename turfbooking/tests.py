@@ -1,3 +1,562 @@
-from django.test import TestCase
+import importlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import Permission, User
+from django.core import mail
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import Resolver404, clear_url_caches, resolve
+from django.utils import timezone
+
+from core.profiling import ProfileMiddleware
+
+from .admin import BookingAdmin, ContactMessageAdmin, NotificationAdmin, TurfAdmin, TurfPriceGridAdmin
+from .models import Booking, ContactMessage, Notification, Turf, TurfBlackout, TurfPriceGrid
+from .notifications import BACKOFF_SECONDS, LEASE_SECONDS, MAX_ATTEMPTS, claim_batch, drain_outbox
+from .pricing import (
+    MAX_PERCENT,
+    MIN_PERCENT,
+    SLOTS_PER_DAY,
+    compute_occupancy,
+    decode_grid,
+    encode_grid,
+    quote_price,
+    rebuild_price_grids,
+)
+from .portal import get_operator_stats
+from .schedule import get_schedule
+
+# A fixed Monday, so weekday maths in the tests never depends on the real date
+MONDAY = date(2026, 3, 2)
+
+
+class TurfTestCase(TestCase):
+    def setUp(self):
+        # Schedules and operator stats live in the cache; don't leak between tests
+        cache.clear()
+        self.player = User.objects.create_user('player', email='player@example.com', password='pass')
+        self.turf = Turf.objects.create(name="The Arena", location="Gurgaon", price_per_hour=Decimal('1000.00'))
+
+    def book(self, day, start, end, status='CONFIRMED', turf=None, user=None):
+        return Booking.objects.create(
+            user=user or self.player, turf=turf or self.turf,
+            date=day, start_time=start, end_time=end, status=status,
+        )
+
+
+# 1. DEMAND PRICING
+class QuotePriceTests(TurfTestCase):
+    def test_flat_rate_without_grid(self):
+        price = quote_price(self.turf, MONDAY, time(18, 0), time(19, 30))
+        self.assertEqual(price, Decimal('1500.00'))
+
+    def test_uses_grid_multipliers(self):
+        grid = bytearray([100] * SLOTS_PER_DAY)
+        for slot in range(72, 76): # 18:00 - 19:00 at 150%
+            grid[slot] = 150
+        price = quote_price(self.turf, MONDAY, time(18, 0), time(20, 0), grid=bytes(grid))
+        self.assertEqual(price, Decimal('2500.00'))
+
+    def test_prorates_partial_slots(self):
+        grid = bytearray([100] * SLOTS_PER_DAY)
+        grid[72] = 200 # 18:00 - 18:15
+        # 10 of the 15 minutes of slot 72 at 200%, then 50 minutes at 100%
+        price = quote_price(self.turf, MONDAY, time(18, 5), time(19, 5), grid=bytes(grid))
+        expected = Decimal('1000') * (10 * 200 + 50 * 100) / (60 * 100)
+        self.assertEqual(price, expected.quantize(Decimal('0.01')))
+
+    def test_reads_stored_grid(self):
+        TurfPriceGrid.objects.create(turf=self.turf, date=MONDAY, multipliers=encode_grid([80] * SLOTS_PER_DAY))
+        self.assertEqual(quote_price(self.turf, MONDAY, time(9), time(10)), Decimal('800.00'))
+
+
+class OccupancyTests(TurfTestCase):
+    def test_normalises_by_weekday_count(self):
+        # 28-day window holds four Mondays; two of them booked 18:00 - 19:00
+        self.book(MONDAY - timedelta(days=7), time(18), time(19))
+        self.book(MONDAY - timedelta(days=14), time(18), time(19))
+        self.book(MONDAY - timedelta(days=7), time(9), time(10), status='CANCELLED')
+
+        occupancy = compute_occupancy([self.turf], MONDAY, lookback_days=28)
+        monday = occupancy[self.turf.id][MONDAY.weekday()]
+
+        self.assertEqual(monday[72:76], [0.5] * 4)
+        self.assertEqual(monday[36], 0) # Cancelled bookings don't count
+        self.assertEqual(list(occupancy[self.turf.id]), [MONDAY.weekday()])
+
+    def test_ignores_bookings_outside_window(self):
+        self.book(MONDAY - timedelta(days=35), time(18), time(19))
+        self.book(MONDAY, time(18), time(19))
+        self.assertEqual(compute_occupancy([self.turf], MONDAY, lookback_days=28), {})
+
+
+class RebuildPriceGridTests(TurfTestCase):
+    def test_busy_slots_surge_and_quiet_weekdays_drop(self):
+        for weeks in range(1, 5):
+            self.book(MONDAY - timedelta(weeks=weeks), time(18), time(19))
+
+        rebuild_price_grids([self.turf], today=MONDAY, horizon_days=7, lookback_days=28)
+
+        monday = decode_grid(TurfPriceGrid.objects.get(turf=self.turf, date=MONDAY).multipliers)
+        self.assertEqual(list(monday[72:76]), [MAX_PERCENT] * 4)
+        self.assertEqual(monday[40], MIN_PERCENT)
+
+        # Turf has history, but never on Tuesdays: the whole day is quiet
+        tuesday = decode_grid(TurfPriceGrid.objects.get(turf=self.turf, date=MONDAY + timedelta(days=1)).multipliers)
+        self.assertEqual(set(tuesday), {MIN_PERCENT})
+
+    def test_turf_without_history_stays_at_base_price(self):
+        rebuild_price_grids([self.turf], today=MONDAY, horizon_days=1)
+        grid = decode_grid(TurfPriceGrid.objects.get(turf=self.turf, date=MONDAY).multipliers)
+        self.assertEqual(set(grid), {100})
+
+    def test_drops_past_grids_and_replaces_existing(self):
+        TurfPriceGrid.objects.create(turf=self.turf, date=MONDAY - timedelta(days=1), multipliers=b'\x01')
+        TurfPriceGrid.objects.create(turf=self.turf, date=MONDAY, multipliers=b'\x01')
+
+        written = rebuild_price_grids([self.turf], today=MONDAY, horizon_days=3)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(
+            sorted(TurfPriceGrid.objects.values_list('date', flat=True)),
+            [MONDAY, MONDAY + timedelta(days=1), MONDAY + timedelta(days=2)],
+        )
+        self.assertEqual(len(TurfPriceGrid.objects.get(date=MONDAY).multipliers), SLOTS_PER_DAY)
+
+
+class PriceLockTests(TurfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.day = date.today() + timedelta(days=3)
+        self.booking = self.book(self.day, time(18), time(19), status='PENDING')
+        # Grid rebuilt after the quote: the slot is now 50% dearer
+        TurfPriceGrid.objects.create(turf=self.turf, date=self.day, multipliers=encode_grid([150] * SLOTS_PER_DAY))
+        self.client.force_login(self.player)
+
+    def test_quote_is_taken_at_creation(self):
+        self.assertEqual(self.booking.total_price, Decimal('1000.00'))
+
+    def test_payment_keeps_quoted_price(self):
+        self.client.post(f'/payment/{self.booking.id}/')
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, 'CONFIRMED')
+        self.assertEqual(self.booking.total_price, Decimal('1000.00'))
+
+    def test_cancel_keeps_quoted_price(self):
+        self.client.get(f'/cancel/{self.booking.id}/')
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, 'CANCELLED')
+        self.assertEqual(self.booking.total_price, Decimal('1000.00'))
+
+    def test_booking_page_gets_raw_percentages(self):
+        # The page scales by base itself, so the view ships the grid untouched
+        price_data = self.client.get(f'/book/{self.turf.id}/').context['price_data']
+        self.assertEqual(price_data['base'], 1000.0)
+        self.assertEqual(price_data['days'][self.day.isoformat()], [150] * SLOTS_PER_DAY)
+
+
+# 2. TURF SCHEDULE
+class ScheduleValidationTests(TurfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.day = date.today() + timedelta(days=3)
+        self.schedule = get_schedule(self.turf)
+
+    def assertRejected(self, start, end, message):
+        with self.assertRaisesMessage(ValidationError, message):
+            self.schedule.validate(self.day, start, end)
+
+    def test_accepts_booking_inside_rules(self):
+        self.schedule.validate(self.day, time(8), time(9, 30))
+
+    def test_operating_hours(self):
+        self.assertRejected(time(3), time(4), "open from 06:00 to 23:00")
+        self.assertRejected(time(22, 30), time(23, 30), "open from 06:00 to 23:00")
+
+    def test_slot_alignment(self):
+        self.assertRejected(time(9, 10), time(10, 10), "15-minute slots")
+
+    def test_min_and_max_duration(self):
+        self.assertRejected(time(9), time(9, 30), "Minimum booking duration is 60 minutes")
+        self.assertRejected(time(8), time(13), "Maximum booking duration is 240 minutes")
+
+    def test_blackout(self):
+        TurfBlackout.objects.create(turf=self.turf, date=self.day, start_time=time(10), end_time=time(12))
+        self.turf.refresh_from_db()
+        with self.assertRaisesMessage(ValidationError, "blocked for maintenance"):
+            get_schedule(self.turf).validate(self.day, time(11), time(12))
+
+
+class TurfRulesTests(TurfTestCase):
+    def test_zero_slot_size_is_rejected(self):
+        self.turf.slot_minutes = 0
+        with self.assertRaises(ValidationError):
+            self.turf.full_clean()
+
+    def test_durations_must_fit_slots(self):
+        self.turf.slot_minutes = 25
+        with self.assertRaisesMessage(ValidationError, "multiple of the slot size"):
+            self.turf.full_clean()
+
+    def test_save_bumps_schedule_version(self):
+        stale = Turf.objects.get(id=self.turf.id)
+        TurfBlackout.objects.create(turf=self.turf, date=MONDAY, start_time=time(10), end_time=time(12))
+        # Saving an outdated copy must not roll the blackout's bump back
+        stale.save()
+        self.assertEqual(stale.schedule_version, 2)
+
+
+class ScheduleCacheTests(TurfTestCase):
+    def test_new_blackout_is_enforced_on_next_booking(self):
+        day = date.today() + timedelta(days=3)
+        self.client.force_login(self.player)
+
+        # Warm the cached schedule, as another worker would have
+        self.client.get(f'/book/{self.turf.id}/')
+        TurfBlackout.objects.create(turf=self.turf, date=day, start_time=time(10), end_time=time(12))
+
+        response = self.client.post(f'/book/{self.turf.id}/', {
+            'date': day.isoformat(), 'start_time': '10:00', 'end_time': '11:00',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "blocked for maintenance")
+        self.assertFalse(Booking.objects.exists())
+
+    def test_blackout_moves_schedule_to_new_cache_key(self):
+        # A stale entry under the old version is simply never read again
+        day = date.today() + timedelta(days=3)
+        old = get_schedule(self.turf)
+        TurfBlackout.objects.create(turf=self.turf, date=day, start_time=time(10), end_time=time(12))
+        self.turf.refresh_from_db()
+        self.assertNotIn(day, old.blackouts)
+        self.assertIn(day, get_schedule(self.turf).blackouts)
+
+
+# 3. NOTIFICATION OUTBOX
+class OutboxEnqueueTests(TurfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.booking = self.book(date.today() + timedelta(days=3), time(18), time(19), status='PENDING')
+        self.client.force_login(self.player)
+
+    def test_payment_queues_one_notification(self):
+        self.client.post(f'/payment/{self.booking.id}/')
+        notification = Notification.objects.get()
+        self.assertEqual(notification.event, 'BOOKING_CONFIRMED')
+        self.assertEqual(notification.recipient, 'player@example.com')
+        self.assertEqual(len(mail.outbox), 0) # Nothing is sent inline
+
+    def test_cancel_queues_one_notification(self):
+        self.client.get(f'/cancel/{self.booking.id}/')
+        self.assertEqual(Notification.objects.get().event, 'BOOKING_CANCELLED')
+
+    def test_contact_queues_one_notification(self):
+        self.client.post('/contact/', {'name': 'Asha', 'email': 'asha@example.com', 'message': 'Hi'})
+        notification = Notification.objects.get()
+        self.assertEqual(notification.event, 'CONTACT_RECEIVED')
+        self.assertIn('asha@example.com', notification.body)
+
+    def test_payment_rolls_back_if_queueing_fails(self):
+        with mock.patch('turfbooking.views.notify_booking_confirmed', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post(f'/payment/{self.booking.id}/')
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, 'PENDING')
+
+    def test_contact_rolls_back_if_queueing_fails(self):
+        with mock.patch('turfbooking.views.notify_contact_received', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post('/contact/', {'name': 'Asha', 'email': 'asha@example.com', 'message': 'Hi'})
+        self.assertFalse(ContactMessage.objects.exists())
+
+
+class OutboxWorkerTests(TestCase):
+    def queue(self, **kwargs):
+        return Notification.objects.create(
+            event='CONTACT_RECEIVED', recipient='support@example.com',
+            subject='Hello', body='Body', **kwargs,
+        )
+
+    def test_delivers_into_mail_outbox(self):
+        notification = self.queue()
+        self.assertEqual(drain_outbox(), (1, 0, 0))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['support@example.com'])
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'SENT')
+        self.assertEqual(notification.attempts, 1)
+        self.assertIsNotNone(notification.sent_at)
+
+    def test_failure_backs_off(self):
+        notification = self.queue(attempts=1)
+        before = timezone.now()
+        with mock.patch('turfbooking.notifications._deliver', side_effect=OSError("SMTP down")):
+            self.assertEqual(drain_outbox(), (0, 1, 0))
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'PENDING')
+        self.assertEqual(notification.attempts, 2)
+        self.assertIn("SMTP down", notification.last_error)
+        # Second attempt failed: wait BACKOFF_SECONDS * 2
+        delay = (notification.next_attempt_at - before).total_seconds()
+        self.assertAlmostEqual(delay, BACKOFF_SECONDS * 2, delta=5)
+
+    def test_gives_up_after_max_attempts(self):
+        notification = self.queue(attempts=MAX_ATTEMPTS - 1)
+        with mock.patch('turfbooking.notifications._deliver', side_effect=OSError):
+            self.assertEqual(drain_outbox(), (0, 0, 1))
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'FAILED')
+        self.assertEqual(notification.attempts, MAX_ATTEMPTS)
+        self.assertEqual(drain_outbox(), (0, 0, 0))
+
+    def test_claimed_rows_are_leased(self):
+        notification = self.queue()
+        before = timezone.now()
+
+        self.assertEqual(claim_batch(), [notification])
+        notification.refresh_from_db()
+        lease = (notification.next_attempt_at - before).total_seconds()
+        self.assertAlmostEqual(lease, LEASE_SECONDS, delta=5)
+
+        # Another worker finds nothing due until the lease runs out
+        self.assertEqual(claim_batch(), [])
+
+    def test_skips_rows_not_yet_due(self):
+        self.queue(next_attempt_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(drain_outbox(), (0, 0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+
+# 4. OPERATOR PORTAL (Tenant isolation)
+class OperatorTestCase(TurfTestCase):
+    def setUp(self):
+        super().setUp()
+        self.day = date.today() + timedelta(days=3)
+        self.alice = self.make_operator('alice')
+        self.bob = self.make_operator('bob')
+        self.root = User.objects.create_superuser('root', password='pass')
+
+        self.alice_turf = Turf.objects.create(owner=self.alice, name="Alice Arena", location="A", price_per_hour=1000)
+        self.bob_turf = Turf.objects.create(owner=self.bob, name="Bob Ground", location="B", price_per_hour=1000)
+        self.alice_booking = self.book(self.day, time(18), time(19), turf=self.alice_turf)
+        self.bob_booking = self.book(self.day, time(18), time(19), turf=self.bob_turf)
+
+    def make_operator(self, username):
+        user = User.objects.create_user(username, password='pass', is_staff=True)
+        # Every permission in the app, so only scoping keeps tenants apart
+        user.user_permissions.set(Permission.objects.filter(content_type__app_label='turfbooking'))
+        return User.objects.get(id=user.id)
+
+    def request_as(self, user):
+        request = RequestFactory().get('/admin/')
+        request.user = user
+        return request
+
+
+class TenantQuerySetTests(OperatorTestCase):
+    def test_turfs_owned_by(self):
+        self.assertEqual(list(Turf.objects.owned_by(self.alice)), [self.alice_turf])
+        self.assertEqual(Turf.objects.owned_by(self.root).count(), 3)
+
+    def test_bookings_for_operator(self):
+        self.assertEqual(list(Booking.objects.for_operator(self.bob)), [self.bob_booking])
+        self.assertEqual(Booking.objects.for_operator(self.root).count(), 2)
+
+
+class OperatorAdminTests(OperatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.site = AdminSite()
+
+    def test_turf_admin_is_scoped(self):
+        admin = TurfAdmin(Turf, self.site)
+        self.assertEqual(list(admin.get_queryset(self.request_as(self.alice))), [self.alice_turf])
+        self.assertEqual(admin.get_queryset(self.request_as(self.root)).count(), 3)
+
+    def test_booking_admin_is_scoped(self):
+        admin = BookingAdmin(Booking, self.site)
+        self.assertEqual(list(admin.get_queryset(self.request_as(self.alice))), [self.alice_booking])
+
+    def test_booking_turf_choices_are_scoped(self):
+        admin = BookingAdmin(Booking, self.site)
+        field = admin.formfield_for_foreignkey(Booking._meta.get_field('turf'), self.request_as(self.alice))
+        self.assertEqual(list(field.queryset), [self.alice_turf])
+
+    def test_booking_user_choices_are_scoped(self):
+        admin = BookingAdmin(Booking, self.site)
+        user_field = Booking._meta.get_field('user')
+        # Only players who booked one of alice's turfs, not bob's customers or staff accounts
+        rival = User.objects.create_user('rival-customer')
+        self.book(self.day, time(20), time(21), turf=self.bob_turf, user=rival)
+
+        field = admin.formfield_for_foreignkey(user_field, self.request_as(self.alice))
+        self.assertEqual(list(field.queryset), [self.player])
+
+        field = admin.formfield_for_foreignkey(user_field, self.request_as(self.root))
+        self.assertEqual(field.queryset.count(), User.objects.count())
+
+    def test_site_wide_admins_are_superuser_only(self):
+        for admin_class, model in [(ContactMessageAdmin, ContactMessage),
+                                   (TurfPriceGridAdmin, TurfPriceGrid),
+                                   (NotificationAdmin, Notification)]:
+            admin = admin_class(model, self.site)
+            self.assertFalse(admin.has_module_permission(self.request_as(self.alice)))
+            self.assertFalse(admin.has_view_permission(self.request_as(self.alice)))
+            self.assertTrue(admin.has_view_permission(self.request_as(self.root)))
+
+    def test_operator_cannot_open_notifications_in_admin(self):
+        self.client.force_login(self.alice)
+        self.assertEqual(self.client.get('/admin/turfbooking/notification/').status_code, 403)
+
+
+class OperatorDashboardTests(OperatorTestCase):
+    def test_shows_only_own_turfs_and_bookings(self):
+        self.client.force_login(self.alice)
+        response = self.client.get('/operator/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['name'] for row in response.context['turf_stats']], ["Alice Arena"])
+        self.assertEqual(list(response.context['upcoming']), [self.alice_booking])
+        self.assertEqual(response.context['totals']['confirmed'], 1)
+        self.assertNotContains(response, "Bob Ground")
+
+    def test_non_operator_is_redirected(self):
+        self.client.force_login(self.player)
+        self.assertRedirects(self.client.get('/operator/'), '/dashboard/')
+
+    def test_revenue_counts_kept_money(self):
+        self.alice_booking.status = 'CANCELLED'
+        self.alice_booking.refund_amount = Decimal('400.00')
+        self.alice_booking.save()
+        totals = get_operator_stats(self.alice)['totals']
+        self.assertEqual(totals['revenue'], Decimal('600.00'))
+        self.assertEqual(totals['refunded'], Decimal('400.00'))
+
+
+class OperatorStatsCacheTests(OperatorTestCase):
+    def test_new_booking_refreshes_owner_stats(self):
+        self.assertEqual(get_operator_stats(self.alice)['totals']['confirmed'], 1)
+        self.book(self.day, time(20), time(21), turf=self.alice_turf)
+        self.assertEqual(get_operator_stats(self.alice)['totals']['confirmed'], 2)
+
+    def test_superuser_stats_are_never_stale(self):
+        self.assertEqual(get_operator_stats(self.root)['totals']['confirmed'], 2)
+        self.book(self.day, time(20), time(21), turf=self.bob_turf)
+        self.assertEqual(get_operator_stats(self.root)['totals']['confirmed'], 3)
+
+    def test_moving_a_turf_refreshes_both_owners(self):
+        self.assertEqual(get_operator_stats(self.alice)['totals']['turfs'], 1)
+        self.assertEqual(get_operator_stats(self.bob)['totals']['turfs'], 1)
+
+        self.alice_turf.owner = self.bob
+        self.alice_turf.save()
+
+        self.assertEqual(get_operator_stats(self.alice)['totals']['turfs'], 0)
+        self.assertEqual(get_operator_stats(self.bob)['totals']['turfs'], 2)
+
+
+# 5. PROFILING & SETTINGS
+class ProfilingTestCase(TurfTestCase):
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.profile_dir = Path(tmp.name)
+
+    def profiles(self):
+        return sorted(path.name for path in self.profile_dir.rglob('*.prof'))
+
+
+class ProfileMiddlewareTests(ProfilingTestCase):
+    def get(self, path):
+        with override_settings(PROFILE_DIR=self.profile_dir, PROFILE_VIEWS=['book_turf']):
+            middleware = ProfileMiddleware(lambda request: HttpResponse("ok"))
+            return middleware(RequestFactory().get(path))
+
+    def test_writes_prof_file_for_listed_view(self):
+        with self.assertLogs('core.profiling', 'WARNING'):
+            self.assertContains(self.get(f'/book/{self.turf.id}/'), "ok")
+        profiles = self.profiles()
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].startswith('book_turf-'))
+
+    def test_skips_views_not_listed(self):
+        self.assertContains(self.get('/about/'), "ok")
+        self.assertEqual(self.profiles(), [])
+
+    def test_unknown_url_passes_through(self):
+        self.assertContains(self.get('/no-such-page/'), "ok")
+        self.assertEqual(self.profiles(), [])
+
+
+class ProfileCommandTests(ProfilingTestCase):
+    def profile_view(self, *args):
+        call_command('profile_view', *args, '--requests', '1', stdout=io.StringIO())
+
+    def test_writes_output_into_new_directory(self):
+        output = self.profile_dir / 'nested' / 'book.prof'
+        self.profile_view('book_turf', f'turf_id={self.turf.id}', '--user', 'player', '--output', str(output))
+        self.assertTrue(output.exists())
+
+    def test_rejects_malformed_kwargs(self):
+        with self.assertRaisesMessage(CommandError, "URL kwargs must be key=value"):
+            self.profile_view('book_turf', str(self.turf.id))
+
+    def test_rejects_zero_requests(self):
+        with self.assertRaisesMessage(CommandError, "--requests must be at least 1"):
+            call_command('profile_view', 'about', '--requests', '0')
+
+    def test_login_redirect_suggests_user(self):
+        # book_turf needs a login, so without --user the warm-up GET is a 302
+        with self.assertRaisesMessage(CommandError, "returned 302 (pass --user"):
+            self.profile_view('book_turf', f'turf_id={self.turf.id}', '--output', str(self.profile_dir / 'x.prof'))
+        self.assertEqual(self.profiles(), [])
+
+    def test_startup_failure_reports_exit_code(self):
+        failed = subprocess.CompletedProcess(args=[], returncode=3, stdout='', stderr='')
+        with mock.patch('turfbooking.management.commands.profile_startup.subprocess.run', return_value=failed):
+            with self.assertRaisesMessage(CommandError, "exited with code 3"):
+                call_command('profile_startup', stdout=io.StringIO())
+
+
+class ProductionSettingsTests(TestCase):
+    def test_requires_secret_key(self):
+        with mock.patch.dict(os.environ), mock.patch.dict(sys.modules):
+            os.environ.pop('DJANGO_SECRET_KEY', None)
+            sys.modules.pop('core.settings.production', None)
+            with self.assertRaisesMessage(ImproperlyConfigured, "DJANGO_SECRET_KEY"):
+                importlib.import_module('core.settings.production')
+
+    def test_media_is_not_served_without_debug(self):
+        import core.urls
+
+        def media_routed():
+            importlib.reload(core.urls)
+            clear_url_caches()
+            try:
+                resolve('/media/turfs/pitch.jpg')
+            except Resolver404:
+                return False
+            return True
+
+        self.addCleanup(media_routed) # Rebuild the URLconf with the real settings
+        with override_settings(DEBUG=False):
+            self.assertFalse(media_routed())
+        with override_settings(DEBUG=True):
+            self.assertTrue(media_routed())
@@ -20,4 +20,7 @@ urlpatterns = [
     path('book/<int:turf_id>/', views.book_turf, name='book_turf'),
     path('payment/<int:booking_id>/', views.payment, name='payment'),
     path('cancel/<int:booking_id>/', views.cancel_booking, name='cancel_booking'),
+
+    # Venue Operators
+    path('operator/', views.operator_dashboard, name='operator_dashboard'),
 ]
\ No newline at end of file
@@ -3,15 +3,18 @@ from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
 from django.contrib import messages
+from django.db import transaction
 from django.db.models import Q 
 from django.core.exceptions import ValidationError 
 from django.utils import timezone
-from django.core.serializers.json import DjangoJSONEncoder
-import json
 import datetime
 
 from .models import Turf, Booking
 from .forms import SignUpForm, BookingForm, ContactForm
+from .schedule import get_schedule
+from .portal import get_operator_stats
+from .notifications import notify_booking_confirmed, notify_booking_cancelled, notify_contact_received
+from .pricing import DEFAULT_HORIZON_DAYS, SLOT_MINUTES, get_grids
 
 # --- PUBLIC PAGES ---
 
@@ -41,7 +44,10 @@ def contact(request):
     if request.method == 'POST':
         form = ContactForm(request.POST)
         if form.is_valid():
-            form.save()
+            # Save + queue the notification together (sent later by the outbox worker)
+            with transaction.atomic():
+                contact_message = form.save()
+                notify_contact_received(contact_message)
             messages.success(request, "Message Received! We will deploy a support agent shortly.")
             return redirect('contact')
     else:
@@ -96,8 +102,21 @@ def book_turf(request, turf_id):
         status__in=['CONFIRMED', 'PENDING']  # Block pending slots too!
     ).values('date', 'start_time', 'end_time')
 
-    # 2. Convert to JSON for the Frontend JavaScript
-    busy_data = json.dumps(list(busy_slots), cls=DjangoJSONEncoder)
+    # 2. Availability payload for the Frontend JavaScript.
+    # The turf schedule is the same cached object Booking.clean() validates against.
+    availability = {
+        'busy': list(busy_slots),
+        'schedule': get_schedule(turf).to_payload(),
+    }
+
+    # 3. Demand prices for the upcoming days (one query), sent as raw percentages;
+    #    the page multiplies them by base
+    grids = get_grids(turf, datetime.date.today(), DEFAULT_HORIZON_DAYS)
+    price_data = {
+        'slot_minutes': SLOT_MINUTES,
+        'base': float(turf.price_per_hour),
+        'days': {day.isoformat(): list(grid) for day, grid in grids.items()},
+    }
 
     if request.method == 'POST':
         form = BookingForm(request.POST)
@@ -125,7 +144,7 @@ def book_turf(request, turf_id):
     else:
         form = BookingForm()
     
-    return render(request, 'booking.html', {'form': form, 'turf': turf, 'busy_data': busy_data})
+    return render(request, 'booking.html', {'form': form, 'turf': turf, 'availability': availability, 'price_data': price_data})
 
 # --- PAYMENT & CANCELLATION ---
 
@@ -140,8 +159,10 @@ def payment(request, booking_id):
         return redirect('dashboard')
         
     if request.method == 'POST':
-        booking.status = 'CONFIRMED'
-        booking.save()
+        with transaction.atomic():
+            booking.status = 'CONFIRMED'
+            booking.save()
+            notify_booking_confirmed(booking)
         messages.success(request, "Payment Successful! Game On.")
         return redirect('dashboard')
         
@@ -159,10 +180,12 @@ def cancel_booking(request, booking_id):
     # 1. Calculate Refund based on logic
     refund_amount, reason = booking.calculate_refund()
     
-    # 2. Update Booking
-    booking.status = 'CANCELLED'
-    booking.refund_amount = refund_amount
-    booking.save()
+    # 2. Update Booking (and queue the email in the same transaction)
+    with transaction.atomic():
+        booking.status = 'CANCELLED'
+        booking.refund_amount = refund_amount
+        booking.save()
+        notify_booking_cancelled(booking, reason)
     
     # 3. Logic-Specific Messages
     if refund_amount > 0:
@@ -170,4 +193,26 @@ def cancel_booking(request, booking_id):
     else:
         messages.warning(request, f"Booking Cancelled. No refund applicable. Reason: {reason}")
     
-    return redirect('dashboard')
\ No newline at end of file
+    return redirect('dashboard')
+
+# --- OPERATOR PORTAL ---
+
+@login_required
+def operator_dashboard(request):
+    # Stats are cached per operator, so a repeat visit is one indexed query
+    stats = get_operator_stats(request.user)
+    if not stats['turfs'] and not request.user.is_superuser:
+        messages.info(request, "The operator portal is for venue owners only.")
+        return redirect('dashboard')
+
+    # STRICT TENANCY: only bookings on turfs this operator owns
+    upcoming = Booking.objects.for_operator(request.user).filter(
+        date__gte=datetime.date.today(),
+        status__in=['CONFIRMED', 'PENDING'],
+    ).select_related('turf', 'user').order_by('date', 'start_time')[:20]
+
+    return render(request, 'operator_dashboard.html', {
+        'totals': stats['totals'],
+        'turf_stats': stats['turfs'],
+        'upcoming': upcoming,
+    })